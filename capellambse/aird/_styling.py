@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import collections.abc as cabc
+import functools
 import struct
 import typing as t
 
@@ -14,6 +15,36 @@ from capellambse import diagram
 
 from ._common import LOGGER
 
+_OWNEDSTYLE_ATTRIBUTES = (
+    "backgroundColor",
+    "borderColor",
+    "borderSize",
+    "color",
+    "foregroundColor",
+    "labelColor",
+    "lineStyle",
+    "size",
+    "strokeColor",
+)
+"""Attributes of an ``ownedStyle`` that affect the style overrides.
+
+The computed overrides are cached based on the values of these
+attributes, so any attribute that is used to calculate them must be
+listed here. The cache also assumes that :data:`diagram.STYLES` does
+not change at runtime, as the default styles are filtered out inside
+the cached function.
+"""
+_VISUALELEMENT_ATTRIBUTES = (
+    "fillColor",
+    "fontColor",
+    "lineColor",
+    "lineWidth",
+)
+"""Attributes of a visual element that affect the style overrides.
+
+See :data:`_OWNEDSTYLE_ATTRIBUTES`.
+"""
+
 
 def apply_style_overrides(
     diagram_class: str | None,
@@ -32,24 +63,35 @@ def apply_style_overrides(
     ostyle
         An ownedStyle element.
     """
-
-    def _to_rgb(
-        ostyle: lxml.etree._Element, attrib: str
-    ) -> diagram.RGB | None:
-        color = ostyle.get(attrib)
-        if color is not None:
-            color = diagram.RGB.fromcsv(color)
-        return color
-
     if diagram_class is None:
         return {}
 
+    attributes = tuple(ostyle.get(i) for i in _OWNEDSTYLE_ATTRIBUTES)
+    return _copy_styles(
+        _style_overrides(diagram_class, element_class, attributes)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _style_overrides(
+    diagram_class: str,
+    element_class: str,
+    attributes: tuple[str | None, ...],
+) -> dict[str, str | diagram.RGB | list[str | diagram.RGB]]:
+    ostyle = dict(zip(_OWNEDSTYLE_ATTRIBUTES, attributes))
+
+    def _to_rgb(attrib: str) -> diagram.RGB | None:
+        color = ostyle[attrib]
+        if color is not None:
+            return diagram.RGB.fromcsv(color)
+        return None
+
     styleoverrides: dict[str, diagram.CSSdef] = {}
 
     # Background color
-    color = _to_rgb(ostyle, "color")
-    bgcolor = _to_rgb(ostyle, "backgroundColor")
-    fgcolor = _to_rgb(ostyle, "foregroundColor")
+    color = _to_rgb("color")
+    bgcolor = _to_rgb("backgroundColor")
+    fgcolor = _to_rgb("foregroundColor")
     if color:
         styleoverrides["fill"] = color
     elif bgcolor or fgcolor:
@@ -62,9 +104,9 @@ def apply_style_overrides(
             styleoverrides["fill"] = [bgcolor, fgcolor]
 
     # Foreground / font color
-    styleoverrides["text_fill"] = _to_rgb(ostyle, "labelColor")
+    styleoverrides["text_fill"] = _to_rgb("labelColor")
 
-    linestyle = ostyle.attrib.get("lineStyle")
+    linestyle = ostyle["lineStyle"]
     if linestyle == "dash":
         styleoverrides["stroke-dasharray"] = "5"
     elif linestyle == "dot":
@@ -73,11 +115,11 @@ def apply_style_overrides(
         LOGGER.warning("Ignoring unknown line style %s", linestyle)
 
     if element_class.startswith("Edge."):
-        styleoverrides["stroke"] = _to_rgb(ostyle, "strokeColor")
-        styleoverrides["stroke-width"] = ostyle.get("size")
+        styleoverrides["stroke"] = _to_rgb("strokeColor")
+        styleoverrides["stroke-width"] = ostyle["size"]
     elif element_class.startswith("Box."):
-        styleoverrides["stroke"] = _to_rgb(ostyle, "borderColor")
-        styleoverrides["stroke-width"] = ostyle.get("borderSize")
+        styleoverrides["stroke"] = _to_rgb("borderColor")
+        styleoverrides["stroke-width"] = ostyle["borderSize"]
     return _filter_default_styles(diagram_class, element_class, styleoverrides)
 
 
@@ -96,10 +138,24 @@ def apply_visualelement_styles(
     data_element
         The ``<data>`` subtree's child element
     """
+    attributes = tuple(data_element.get(i) for i in _VISUALELEMENT_ATTRIBUTES)
+    return _copy_styles(
+        _visualelement_styles(diagram_class, element_class, attributes)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _visualelement_styles(
+    diagram_class: str,
+    element_class: str,
+    attributes: tuple[str | None, ...],
+) -> dict[str, str | diagram.RGB | list[str | diagram.RGB]]:
+    data_element = dict(zip(_VISUALELEMENT_ATTRIBUTES, attributes))
     styleoverrides: dict[str, t.Any] = {}
 
     def unpack_rgb(color: str, default: int) -> diagram.RGB:
-        color_int = int(data_element.get(color, default))
+        value = data_element[color]
+        color_int = int(default if value is None else value)
         return diagram.RGB(
             *struct.unpack_from("3Bx", struct.pack("<i", color_int))
         )
@@ -108,14 +164,22 @@ def apply_visualelement_styles(
     styleoverrides["fill"] = unpack_rgb("fillColor", 0xFFFFFF)
     styleoverrides["text_fill"] = unpack_rgb("fontColor", 0x000000)
 
-    try:
-        styleoverrides["stroke-width"] = int(data_element.attrib["lineWidth"])
-    except KeyError:
-        pass
+    line_width = data_element["lineWidth"]
+    if line_width is not None:
+        styleoverrides["stroke-width"] = int(line_width)
 
     return _filter_default_styles(diagram_class, element_class, styleoverrides)
 
 
+def _copy_styles(
+    styles: dict[str, str | diagram.RGB | list[str | diagram.RGB]]
+) -> dict[str, str | diagram.RGB | list[str | diagram.RGB]]:
+    """Copy cached styles, so that callers can safely modify them."""
+    return {
+        k: list(v) if isinstance(v, list) else v for k, v in styles.items()
+    }
+
+
 def _filter_default_styles(
     diagram_class: str,
     element_class: str,
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import collections.abc as cabc
 import logging
+import weakref
 
 from capellambse import diagram
 
@@ -19,14 +20,19 @@ from . import _edge_factories, _styling
 
 LOGGER = logging.getLogger(__name__)
 
+_SHAPE_PARENTS: weakref.WeakKeyDictionary[
+    diagram.Diagram, dict[str, diagram.Box | None]
+] = weakref.WeakKeyDictionary()
+
 
 def from_xml(ebd: c.ElementBuilder) -> diagram.DiagramElement:
     """Deserialize a visual element."""
-    el_type = ebd.data_element.attrib[c.ATT_XMT].split(":")[-1]
-    if el_type not in VISUAL_TYPES:
+    el_type = ebd.data_element.attrib[c.ATT_XMT].rpartition(":")[2]
+    try:
+        factory = VISUAL_TYPES[el_type]
+    except KeyError:
         LOGGER.error("Unknown visual element type, skipping: %r", el_type)
-        raise c.SkipObject()
-    factory = VISUAL_TYPES[el_type]
+        raise c.SkipObject() from None
     if factory is None:
         raise c.SkipObject()
     return factory(ebd)
@@ -67,37 +73,22 @@ def shape_factory(ebd: c.ElementBuilder) -> diagram.Box:
 
     uid = ebd.data_element.attrib[c.ATT_XMID]
     label = ebd.data_element.get("description", "")
-    parent = ebd.data_element.getparent()
-    while parent.tag == "children":
-        parent_uid = parent.attrib.get("element") or parent.attrib.get(
-            c.ATT_XMID
-        )
-        try:
-            parent = ebd.target_diagram[parent_uid]
-        except KeyError:
-            parent = parent.getparent()
-        else:
-            refpos = parent.pos
-            break
+    parent = _find_shape_parent(ebd)
+    if parent is not None:
+        refpos = parent.pos
     else:
-        parent = None
         refpos = diagram.Vector2D(0, 0)
 
-    try:
-        layout = next(ebd.data_element.iterchildren("layoutConstraint"))
-    except StopIteration:
-        raise ValueError(
-            "No layoutConstraint found for element {uid}"
-        ) from None
-
-    pos = refpos + (
-        int(layout.attrib.get("x", "0")),
-        int(layout.attrib.get("y", "0")),
-    )
-    size = diagram.Vector2D(
-        int(layout.attrib.get("width", "0")),
-        int(layout.attrib.get("height", "0")),
-    )
+    layout = ebd.data_element.find("layoutConstraint")
+    if layout is None:
+        raise ValueError(f"No layoutConstraint found for element {uid}")
+
+    x = int(layout.get("x", "0"))
+    y = int(layout.get("y", "0"))
+    width = int(layout.get("width", "0"))
+    height = int(layout.get("height", "0"))
+    pos = diagram.Vector2D(refpos.x + x, refpos.y + y)
+    size = diagram.Vector2D(width, height)
     styleclass = ebd.data_element.attrib["type"]
     styleoverrides = _styling.apply_visualelement_styles(
         ebd.target_diagram.styleclass, f"Box.{styleclass}", ebd.data_element
@@ -114,13 +105,51 @@ def shape_factory(ebd: c.ElementBuilder) -> diagram.Box:
     )
 
 
+def _find_shape_parent(ebd: c.ElementBuilder) -> diagram.Box | None:
+    """Find the closest ancestor of a shape that is part of the diagram.
+
+    Resolved ancestors are remembered per target diagram, so that
+    sibling shapes don't need to walk up (and look up) the same chain of
+    ``children`` elements again. The cache is keyed by the ``xmi:id`` of
+    each ``children`` node rather than by its semantic ``element``, as
+    the same semantic element may be shown several times in a diagram.
+    """
+    cache = _SHAPE_PARENTS.setdefault(ebd.target_diagram, {})
+    visited: list[str] = []
+    resolved: diagram.DiagramElement | None = None
+    parent = ebd.data_element.getparent()
+    while parent.tag == "children":
+        node_id = parent.get(c.ATT_XMID)
+        if node_id is not None:
+            try:
+                resolved = cache[node_id]
+            except KeyError:
+                visited.append(node_id)
+            else:
+                break
+
+        parent_uid = parent.get("element") or node_id
+        try:
+            resolved = ebd.target_diagram[parent_uid]
+        except KeyError:
+            parent = parent.getparent()
+        else:
+            break
+
+    assert resolved is None or isinstance(resolved, diagram.Box)
+    for node_id in visited:
+        cache[node_id] = resolved
+    return resolved
+
+
 VISUAL_TYPES: dict[
-    str, cabc.Callable[[c.ElementBuilder], diagram.DiagramElement]
+    str, cabc.Callable[[c.ElementBuilder], diagram.DiagramElement] | None
 ] = {
-    "BasicDecorationNode": c.SkipObject.raise_,
+    # Types mapped to None are silently skipped.
+    "BasicDecorationNode": None,
     "Connector": connector_factory,
     # Nodes are actually semantic elements.  If one got through to here,
     # it's an internal node, not an element root.
-    "Node": c.SkipObject.raise_,
+    "Node": None,
     "Shape": shape_factory,
 }
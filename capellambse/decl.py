@@ -18,6 +18,7 @@ __all__ = [
     "YDMDumper",
     "YDMLoader",
     "apply",
+    "apply_instructions",
     "dump",
     "load",
 ]
@@ -37,6 +38,11 @@ import capellambse
 from capellambse import helpers
 from capellambse.model import common
 
+if t.TYPE_CHECKING:
+    _SafeLoader = yaml.SafeLoader
+else:
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 FileOrPath = t.Union[t.IO[str], str, os.PathLike[t.Any]]
 _FutureAction = dict[str, t.Any]
 _OperatorResult = tuple[
@@ -99,12 +105,39 @@ def apply(model: capellambse.MelodyModel, file: FileOrPath) -> None:
     ``!promise``, but reorderings are still possible even if no promises
     are used in an input document.
     """
-    instructions = collections.deque(load(file))
+    apply_instructions(model, load(file))
+
+
+def apply_instructions(
+    model: capellambse.MelodyModel,
+    instructions: cabc.Iterable[dict[str, t.Any]],
+) -> None:
+    """Apply already loaded instructions to the given model.
+
+    This is the same as :func:`apply`, but skips reading and parsing
+    the YAML. It can be used to apply instructions that were built in
+    Python directly, using :class:`UUIDReference` and :class:`Promise`
+    objects where the YAML would use ``!uuid`` and ``!promise`` tags.
+
+    Parameters
+    ----------
+    model
+        The model to apply the instructions to.
+    instructions
+        The instructions, in the same format as returned by
+        :func:`load`. Note that they are consumed and modified in the
+        process.
+
+    See Also
+    --------
+    apply : Notes about transactionality and the execution order.
+    """
+    queue = collections.deque(instructions)
     promises = dict[Promise, capellambse.ModelObject]()
     deferred = collections.defaultdict[Promise, list[_FutureAction]](list)
 
-    while instructions:
-        instruction = instructions.popleft()
+    while queue:
+        instruction = queue.popleft()
         parent = instruction.pop("parent")
         if isinstance(parent, UUIDReference):
             parent = model.by_uuid(parent.uuid)
@@ -122,7 +155,7 @@ def apply(model: capellambse.MelodyModel, file: FileOrPath) -> None:
                             f"promise_id defined twice: {promise.identifier}"
                         )
                     promises[promise] = outcome
-                    instructions.extend(deferred.pop(promise, ()))
+                    queue.extend(deferred.pop(promise, ()))
         if instruction:
             keys = ", ".join(instruction)
             raise ValueError(f"Unrecognized keys in instruction: {keys}")
@@ -385,8 +418,12 @@ YDMDumper.add_representer(Promise, YDMDumper.represent_promise)
 YDMDumper.add_representer(UUIDReference, YDMDumper.represent_uuidref)
 
 
-class YDMLoader(yaml.SafeLoader):
-    """A YAML loader with extensions for declarative modelling."""
+class YDMLoader(_SafeLoader):
+    """A YAML loader with extensions for declarative modelling.
+
+    If available, this loader is based on the LibYAML backed C
+    implementation.
+    """
 
     def construct_promise(self, node: yaml.Node) -> Promise:
         if not isinstance(node, yaml.ScalarNode):
@@ -4,12 +4,14 @@
 """Property Value Management extension for CapellaMBSE."""
 from __future__ import annotations
 
+import functools
 import typing as t
 
 from lxml import etree
 
 import capellambse
 import capellambse.model.common as c
+import capellambse.pvmt
 import capellambse.pvmt.exceptions as pvexc
 
 
@@ -30,20 +32,25 @@ class PropertyValueProxy:
     """
     # pylint: enable=line-too-long
 
+    __slots__ = ("_element", "_model", "_pvext")
+
     _model: capellambse.MelodyModel
     _element: etree._Element
+    _pvext: capellambse.pvmt.PVMTExtension
 
     @classmethod
     def from_model(
         cls, model: capellambse.MelodyModel, element: etree._Element
     ) -> PropertyValueProxy:
         """Create a PropertyValueProxy for an element."""
-        if not hasattr(model, "_pvext") or model._pvext is None:
+        pvext = getattr(model, "_pvext", None)
+        if pvext is None:
             raise RuntimeError("Cannot access PVMT: extension is not loaded")
 
         self = cls.__new__(cls)
         self._model = model
         self._element = element
+        self._pvext = pvext
         return self
 
     def __init__(self, **kw: t.Any) -> None:
@@ -55,52 +62,83 @@ class PropertyValueProxy:
         return self._element is other._element
 
     def __getitem__(self, key):
-        path = key.split(".")
-        if len(path) < 1 or len(path) > 3:
-            raise ValueError(
-                "Provide a name as `domain`, `domain.group` or"
-                " `domain.group.prop`"
-            )
-
-        domain = _PVMTDomain(self._model, self._element, path[0])
-        if len(path) == 1:
+        domain_name, group, prop = _split_domain_path(key)
+        domain = _PVMTDomain(
+            self._model, self._element, domain_name, self._pvext
+        )
+        if group is None:
             return domain
-        else:
-            return domain[".".join(path[1:])]
+        return domain._lookup(group, prop)
 
 
 class _PVMTDomain:
+    __slots__ = ("_domain", "_element", "_model", "_pvext")
+
     def __init__(
         self,
         model: capellambse.MelodyModel,
         element: etree._Element,
         domain: str,
+        pvext: capellambse.pvmt.PVMTExtension,
     ):
         self._model = model
         self._element = element
         self._domain = domain
+        self._pvext = pvext
 
     def __getitem__(self, key):
-        path = key.split(".")
-        if len(path) < 1 or len(path) > 2:
-            raise ValueError("Provide a name as `group` or `group.prop`")
+        group, prop = _split_group_path(key)
+        return self._lookup(group, prop)
 
+    def _lookup(self, group: str, prop: str | None) -> t.Any:
         try:
-            pvgroup = self._model._pvext.get_element_pv(
-                self._element, f"{self._domain}.{path[0]}", create=False
+            pvgroup = self._pvext.get_element_pv(
+                self._element, f"{self._domain}.{group}", create=False
             )
         except pvexc.GroupNotAppliedError:
             return None
 
-        if len(path) == 1:
+        if prop is None:
             return pvgroup
-        else:
-            return pvgroup[path[1]]
+        return pvgroup[prop]
 
     def __repr__(self) -> str:
         return f"<PVMTDomain {self._domain!r} on {self._model!r}>"
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_domain_path(key: str) -> tuple[str, str | None, str | None]:
+    """Split a ``domain.group.prop`` path into its components.
+
+    Missing trailing components are returned as None. The result is
+    cached, as usually the same few paths are looked up on many
+    different objects.
+    """
+    domain, sep, rest = key.partition(".")
+    if not sep:
+        return domain, None, None
+    if rest.count(".") > 1:
+        raise ValueError(
+            "Provide a name as `domain`, `domain.group` or `domain.group.prop`"
+        )
+    group, sep, prop = rest.partition(".")
+    return domain, group, (prop if sep else None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_group_path(key: str) -> tuple[str, str | None]:
+    """Split a ``group.prop`` path into its components.
+
+    See Also
+    --------
+    _split_domain_path
+    """
+    group, sep, prop = key.partition(".")
+    if "." in prop:
+        raise ValueError("Provide a name as `group` or `group.prop`")
+    return group, (prop if sep else None)
+
+
 def init() -> None:
     c.set_accessor(
         c.GenericElement, "pvmt", c.AlternateAccessor(PropertyValueProxy)
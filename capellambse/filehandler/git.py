@@ -445,6 +445,24 @@ class _GitTransaction:
         return tree_hash
 
 
+@functools.lru_cache(maxsize=None)
+def _prepare_askpass() -> str:
+    """Return the path to the bundled askpass helper.
+
+    The helper is made executable on the first call only.
+    """
+    path_to_askpass = (
+        pathlib.Path(__file__).parent / "git_askpass.py"
+    ).absolute()
+
+    try:
+        os.chmod(path_to_askpass, 0o755)
+    except OSError:
+        LOGGER.info("Setting permission 755 for GIT_ASKPASS file failed")
+
+    return str(path_to_askpass)
+
+
 class GitFileHandler(FileHandler):
     """File handler for ``git://`` and related protocols.
 
@@ -634,18 +652,7 @@ class GitFileHandler(FileHandler):
     def __get_git_env(self) -> dict[str, str]:
         git_env = os.environ.copy()
         if not os.environ.get("GIT_ASKPASS"):
-            path_to_askpass = (
-                pathlib.Path(__file__).parent / "git_askpass.py"
-            ).absolute()
-
-            git_env["GIT_ASKPASS"] = str(path_to_askpass)
-
-            try:
-                os.chmod(path_to_askpass, 0o755)
-            except OSError:
-                LOGGER.info(
-                    "Setting permission 755 for GIT_ASKPASS file failed"
-                )
+            git_env["GIT_ASKPASS"] = _prepare_askpass()
 
         if self.username and self.password:
             git_env["GIT_USERNAME"] = self.username
@@ -831,7 +838,7 @@ class GitFileHandler(FileHandler):
         stderr = None
         try:
             proc = subprocess.run(
-                ["git"] + [str(i) for i in cmd],
+                ["git", *map(str, cmd)],
                 capture_output=True,
                 check=True,
                 cwd=self.cache_dir,
@@ -851,10 +858,11 @@ class GitFileHandler(FileHandler):
             else:
                 level = logging.DEBUG
 
-            if stderr:
+            stderr_logger = LOGGER.getChild("git")
+            if stderr and stderr_logger.isEnabledFor(level):
                 if isinstance(stderr, bytes):
-                    stderr = stderr.decode("utf-8")
+                    stderr = stderr.decode("utf-8", errors="replace")
 
                 for line in stderr.splitlines():
-                    LOGGER.getChild("git").log(level, "%s", line)
+                    stderr_logger.log(level, "%s", line)
             LOGGER.log(level, "Exit status: %d", returncode)
@@ -1164,7 +1164,7 @@ class _Specification(t.MutableMapping[str, str]):
             yield i.text or ""
 
     def __len__(self) -> int:
-        return sum(1 for _ in self)
+        return sum(1 for _ in self._element.iterchildren("languages"))
 
     def __setitem__(self, k: str, v: str) -> None:
         k = self._aliases.get(k, k)
@@ -1281,6 +1281,9 @@ class ReferenceSearchingAccessor(PhysicalAccessor[T]):
         if obj is None:  # pragma: no cover
             return self
 
+        # Compare the underlying XML elements directly, which avoids
+        # wrapping every referenced element into a model object
+        target = obj._element
         matches: list[etree._Element] = []
         for candidate in obj._model.search(*self.target_classes):
             for attr in self.attrs:
@@ -1290,9 +1293,9 @@ class ReferenceSearchingAccessor(PhysicalAccessor[T]):
                     continue
                 if (
                     isinstance(value, element.ElementList)
-                    and obj in value
+                    and any(i is target for i in value._elements)
                     or isinstance(value, element.GenericElement)
-                    and obj == value
+                    and value._element is target
                 ):
                     matches.append(candidate._element)
                     break
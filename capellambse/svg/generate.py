@@ -146,6 +146,8 @@ class DiagramMetadata:
     e.g. ``LogicalArchitectureBlank``.
     """
 
+    __slots__ = ("pos", "size", "viewbox", "name", "class_")
+
     pos: tuple[float, float]
     size: tuple[float, float]
     viewbox: str
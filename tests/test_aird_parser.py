@@ -92,3 +92,28 @@ def test_airdparser_msm_produces_valid_json_without_error(
 
     generated_json = diagram.DiagramJSONEncoder(indent=4).encode(parsed)
     json.loads(generated_json)
+
+
+def test_changing_parsed_style_overrides_does_not_affect_other_boxes(
+    model: capellambse.MelodyModel,
+):
+    diag_name = "[CDB] Union tests"
+    all_diagrams = aird.enumerate_diagrams(model._loader)
+    descriptor = next(i for i in all_diagrams if i.name == diag_name)
+    parsed = aird.parse_diagram(model._loader, descriptor)
+    box, sibling = [
+        i
+        for i in parsed
+        if isinstance(i, diagram.Box)
+        and isinstance(i.styleoverrides.get("fill"), list)
+    ][:2]
+    fill = box.styleoverrides["fill"]
+    assert isinstance(fill, list) and box.uuid is not None
+    expected = list(fill)
+    assert sibling.styleoverrides["fill"] == expected
+
+    fill[0] = "#FF0000"
+
+    assert sibling.styleoverrides["fill"] == expected
+    reparsed = aird.parse_diagram(model._loader, descriptor)
+    assert reparsed[box.uuid].styleoverrides["fill"] == expected
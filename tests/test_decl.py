@@ -6,20 +6,15 @@ import hashlib
 import io
 import pathlib
 import shutil
-import subprocess
-import sys
 
 import pytest
+from click.testing import CliRunner
 
 import capellambse
 from capellambse import decl, helpers
 
 # pylint: disable-next=relative-beyond-top-level, useless-suppression
-from .conftest import (  # type: ignore[import]
-    INSTALLED_PACKAGE,
-    TEST_MODEL,
-    TEST_ROOT,
-)
+from .conftest import TEST_MODEL, TEST_ROOT  # type: ignore[import]
 
 DATAPATH = pathlib.Path(__file__).parent / "data" / "decl"
 MODELPATH = pathlib.Path(TEST_ROOT / "5_0")
@@ -137,6 +132,24 @@ class TestApplyExtend:
         for i in ("first", "second", "third"):
             assert f"pass the {i} test" in parent_obj.functions.by_name
 
+    @staticmethod
+    def test_apply_instructions_accepts_python_objects(
+        model: capellambse.MelodyModel,
+    ) -> None:
+        funcname = "pass the unit test"
+        instructions = [
+            {
+                "parent": decl.UUIDReference(ROOT_FUNCTION),
+                "extend": {"functions": [{"name": funcname}]},
+            }
+        ]
+        parent_obj = model.by_uuid(ROOT_FUNCTION)
+        assert funcname not in parent_obj.functions.by_name
+
+        decl.apply_instructions(model, instructions)
+
+        assert funcname in parent_obj.functions.by_name
+
     @staticmethod
     def test_decl_creates_nested_complex_objects_where_they_belong(
         model: capellambse.MelodyModel,
@@ -268,48 +281,34 @@ class TestApplyExtend:
 
 class TestApplyPromises:
     @staticmethod
-    def test_promises_can_backwards_reference_objects(
-        model: capellambse.MelodyModel,
+    @pytest.mark.parametrize(
+        "order",
+        [
+            pytest.param((0, 1), id="backward"),
+            pytest.param((1, 0), id="forward"),
+        ],
+    )
+    def test_promises_can_reference_objects(
+        model: capellambse.MelodyModel, order
     ) -> None:
         root_func = model.by_uuid(ROOT_FUNCTION)
         root_comp = model.by_uuid(ROOT_COMPONENT)
-        yml = f"""\
+        snippets = (
+            f"""
             - parent: !uuid {ROOT_FUNCTION}
               extend:
                 functions:
                   - name: pass the unit test
                     promise_id: pass-test
+            """,
+            f"""
             - parent: !uuid {ROOT_COMPONENT}
               extend:
                 allocated_functions:
                   - !promise pass-test
-            """
-        expected_len = len(root_comp.allocated_functions) + 1
-
-        decl.apply(model, io.StringIO(yml))
-
-        actual_len = len(root_comp.allocated_functions)
-        assert actual_len == expected_len
-        assert "pass the unit test" in root_func.functions.by_name
-        assert "pass the unit test" in root_comp.allocated_functions.by_name
-
-    @staticmethod
-    def test_promises_can_forward_reference_objects(
-        model: capellambse.MelodyModel,
-    ) -> None:
-        root_func = model.by_uuid(ROOT_FUNCTION)
-        root_comp = model.by_uuid(ROOT_COMPONENT)
-        yml = f"""\
-            - parent: !uuid {ROOT_COMPONENT}
-              extend:
-                allocated_functions:
-                  - !promise pass-test
-            - parent: !uuid {ROOT_FUNCTION}
-              extend:
-                functions:
-                  - name: pass the unit test
-                    promise_id: pass-test
-            """
+            """,
+        )
+        yml = snippets[order[0]] + snippets[order[1]]
         expected_len = len(root_comp.allocated_functions) + 1
 
         decl.apply(model, io.StringIO(yml))
@@ -522,12 +521,13 @@ def test_cli_applies_a_yaml_and_saves_the_model_back(tmp_path: pathlib.Path):
     oldhash = hashlib.sha256(semmodel.read_bytes()).hexdigest()
     declfile = DATAPATH / "coffee-machine.yml"
 
-    cli = subprocess.run(
-        [sys.executable, "-mcapellambse.decl", f"--model={model}", declfile],
-        cwd=INSTALLED_PACKAGE.parent,
-        check=False,
+    # mypy infers the type of the ImportError fallback for `_main`,
+    # but with click installed it is a click.Command
+    cli = CliRunner().invoke(
+        decl._main,  # type: ignore[arg-type]
+        [f"--model={model}", str(declfile)],
     )
 
-    assert cli.returncode == 0, "CLI process exited unsuccessfully"
+    assert cli.exit_code == 0, cli.output
     newhash = hashlib.sha256(semmodel.read_bytes()).hexdigest()
     assert newhash != oldhash, "Files on disk didn't change"
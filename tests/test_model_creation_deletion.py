@@ -3,6 +3,7 @@
 
 """Tests for creating and deleting model elements."""
 # pylint: disable=missing-function-docstring, redefined-outer-name
+import copy
 import pathlib
 
 import pytest
@@ -15,11 +16,29 @@ TEST_MODEL = "WriteTestModel.aird"
 XPATH_UUID = "//*[@id={!r}]"
 
 
-@pytest.fixture
-def model():
+@pytest.fixture(scope="module")
+def base_model() -> capellambse.MelodyModel:
     return capellambse.MelodyModel(TEST_ROOT / TEST_MODEL)
 
 
+@pytest.fixture
+def model(base_model: capellambse.MelodyModel):
+    """Return the shared test model, rolling back changes afterwards.
+
+    Instead of loading the model again for every test, the XML trees of
+    the module-wide instance are snapshotted before the test runs and
+    restored when it is done.
+    """
+    trees = base_model._loader.trees
+    snapshot = {
+        k: copy.deepcopy(v.root.getroottree()) for k, v in trees.items()
+    }
+    yield base_model
+    for k, tree in trees.items():
+        tree.root = snapshot[k].getroot()
+    base_model._loader.idcache_rebuild()
+
+
 def test_created_elements_can_be_accessed_in_model(
     model: capellambse.MelodyModel,
 ):
@@ -585,7 +585,10 @@ def test_model_search_below_filters_elements_by_ancestor(
 
 @pytest.mark.parametrize(
     "xtype",
-    {i for map in c.XTYPE_HANDLERS.values() for i in map.values()},
+    sorted(
+        {i for map in c.XTYPE_HANDLERS.values() for i in map.values()},
+        key=str,
+    ),
 )
 def test_model_search_does_not_contain_duplicates(
     session_shared_model: capellambse.MelodyModel, xtype: type[t.Any]
@@ -8,6 +8,7 @@ import tempfile
 
 import pytest
 
+import capellambse
 from capellambse import loader, pvmt
 
 TEST_ROOT = pathlib.Path(__file__).parent / "data" / "pvmt"
@@ -237,3 +238,39 @@ class TestAppliedPropertyValueGroupXML:
 
         obj_ids["Object ID"] = "CABLE-0001"
         self.compare_xml(model, "apply.capella")
+
+
+class TestPropertyValueProxy:
+    """Tests for the ``pvmt`` accessor on model objects."""
+
+    elem_uuid = "d32caffc-b9a1-448e-8e96-65a36ba06292"
+
+    @pytest.fixture
+    def melodymodel(self):
+        return capellambse.MelodyModel(TEST_ROOT / MODEL_FILE)
+
+    def test_dotted_paths_resolve_to_domain_group_and_value(self, melodymodel):
+        obj = melodymodel.by_uuid(self.elem_uuid)
+
+        group = obj.pvmt["Computer.Physical Cables"]
+        assert group is not None
+        assert obj.pvmt["Computer.Physical Cables.Label"] == "DisplayPort_1"
+        assert obj.pvmt["Computer"]["Physical Cables.Price"] == 14.99
+        assert obj.pvmt["Computer"]["Physical Cables"] == group
+
+    def test_unapplied_groups_resolve_to_None(self, melodymodel):
+        obj = melodymodel.by_uuid(self.elem_uuid)
+
+        assert obj.pvmt["Computer.Components"] is None
+        assert obj.pvmt["Computer.Components.ComponentType"] is None
+
+    @pytest.mark.parametrize(
+        "key", ["a.b.c.d", "Computer.Physical Cables.Label.x"]
+    )
+    def test_too_long_paths_raise_ValueError(self, melodymodel, key):
+        obj = melodymodel.by_uuid(self.elem_uuid)
+
+        with pytest.raises(ValueError, match="domain.group.prop"):
+            obj.pvmt[key]  # pylint: disable=pointless-statement
+        with pytest.raises(ValueError, match="group.prop"):
+            obj.pvmt["Computer"][key]  # pylint: disable=pointless-statement
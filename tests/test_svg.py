@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+import collections
 import json
 import logging
 import pathlib
+import typing as t
 
 import cssutils
 import pytest
@@ -36,36 +38,289 @@ TEST_DIAGS = [
     "[LDFB] Test flow",
     "[CC] Capability",
 ]
-TEST_DECO = set(style.STATIC_DECORATIONS.keys()) - {"__GLOBAL__"}
-FREE_SYMBOLS = {
-    "OperationalCapabilitySymbol",
-    "AndControlNodeSymbol",
-    "ItControlNodeSymbol",
-    "OrControlNodeSymbol",
-    "FinalStateSymbol",
-    "InitialPseudoStateSymbol",
-    "TerminatePseudoStateSymbol",
-    "StickFigureSymbol",
+TEST_DECO = tuple(
+    sorted(k for k in style.STATIC_DECORATIONS if k != "__GLOBAL__")
+)
+FREE_SYMBOLS = frozenset(
+    {
+        "OperationalCapabilitySymbol",
+        "AndControlNodeSymbol",
+        "ItControlNodeSymbol",
+        "OrControlNodeSymbol",
+        "FinalStateSymbol",
+        "InitialPseudoStateSymbol",
+        "TerminatePseudoStateSymbol",
+        "StickFigureSymbol",
+    }
+)
+SVG_NAMESPACES = {"svg": "http://www.w3.org/2000/svg"}
+XPATH_CLASSES = etree.XPath("//@class")
+XPATH_STYLESHEETS = etree.XPath(
+    "/svg:svg/svg:defs/svg:style/text()", namespaces=SVG_NAMESPACES
+)
+XPATH_SYMBOL_IDS = etree.XPath("//svg:symbol/@id", namespaces=SVG_NAMESPACES)
+
+CSS_COLORS_TO_CHECK = {
+    ".LogicalArchitectureBlank g.Box.CP_IN > line": {"stroke": "#000000"},
+    ".LogicalArchitectureBlank g.Box.CP_IN > rect,"
+    " .LogicalArchitectureBlank g.Box.CP_IN > use": {
+        "fill": "#FFFFFF",
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.CP_OUT > line": {"stroke": "#000000"},
+    ".LogicalArchitectureBlank g.Box.CP_OUT > rect,"
+    " .LogicalArchitectureBlank g.Box.CP_OUT > use": {
+        "fill": "#FFFFFF",
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.CP_INOUT > line": {"stroke": "#000000,"},
+    ".LogicalArchitectureBlank g.Box.CP_INOUT > rect,"
+    " .LogicalArchitectureBlank g.Box.CP_INOUT > use": {
+        "fill": "#FFFFFF",
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Edge > path": {
+        "fill": "none",
+        "stroke": "rgb(0, 0, 0)",
+    },
+    ".LogicalArchitectureBlank g.Box > line": {"stroke": "#000000"},
+    ".LogicalArchitectureBlank g.Box > rect,"
+    " .LogicalArchitectureBlank g.Box > use": {
+        "fill": "transparent",
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.Annotation > line": {
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Box.Annotation > rect,"
+    " .LogicalArchitectureBlank g.Box.Annotation > use": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Box.Constraint > line": {
+        "stroke": "#888888",
+    },
+    ".LogicalArchitectureBlank g.Box.Constraint > rect,"
+    " .LogicalArchitectureBlank g.Box.Constraint > use": {
+        "fill": "#FFF5B5",
+        "stroke": "#888888",
+    },
+    ".LogicalArchitectureBlank g.Box.Constraint > text": {"fill": "#000000"},
+    ".LogicalArchitectureBlank g.Box.Note > line": {"stroke": "#FFCC66"},
+    ".LogicalArchitectureBlank g.Box.Note > rect,"
+    " .LogicalArchitectureBlank g.Box.Note > use": {
+        "fill": " #FFFFCB",
+        "stroke": " #FFCC66",
+    },
+    ".LogicalArchitectureBlank g.Box.Note > text": {
+        "fill": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.Requirement > line": {
+        "stroke": "#72496E",
+    },
+    ".LogicalArchitectureBlank g.Box.Requirement > rect,"
+    " .LogicalArchitectureBlank g.Box.Requirement > use": {
+        "fill": "#D9C4D7",
+        "stroke": "#72496E",
+    },
+    ".LogicalArchitectureBlank g.Box.Requirement > text": {
+        "fill": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.Text > line": {
+        "stroke": "transparent",
+    },
+    ".LogicalArchitectureBlank g.Box.Text > rect,"
+    " .LogicalArchitectureBlank g.Box.Text > use": {
+        "stroke": "transparent",
+    },
+    ".LogicalArchitectureBlank g.Edge > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle > circle": {
+        "fill": "#000000",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.Connector > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.Connector > circle": {
+        "fill": "#B0B0B0",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.Connector > path": {
+        "stroke": "#B0B0B0",
+    },
+    ".LogicalArchitectureBlank g.Edge.Constraint > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.Constraint > circle": {
+        "fill": "#000000",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.Constraint > path": {
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Edge.Note > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.Note > circle": {
+        "fill": "#000000",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.Note > path": {
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Edge.RequirementRelation > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.RequirementRelation"
+    " > circle": {
+        "fill": "#72496E",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.RequirementRelation > path": {
+        "stroke": "#72496E"
+    },
+    ".LogicalArchitectureBlank g.Edge.RequirementRelation > text": {
+        "fill": "#72496E",
+    },
+    ".LogicalArchitectureBlank g.Box.CP > line": {
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.CP > rect,"
+    " .LogicalArchitectureBlank g.Box.CP > use": {
+        "fill": "#FFFFFF",
+        "stroke": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.FIP > rect,"
+    " .LogicalArchitectureBlank g.Box.FIP > use": {
+        "fill": "#E08503",
+    },
+    ".LogicalArchitectureBlank g.Box.FOP > rect,"
+    " .LogicalArchitectureBlank g.Box.FOP > use": {
+        "fill": "#095C2E",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalActor > line": {
+        "stroke": "#4A4A97",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalActor > text": {
+        "fill": "#000000",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalComponent > line": {
+        "stroke": "#4A4A97",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalComponent > text": {
+        "fill": "#4A4A97",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalFunction > line": {
+        "stroke": "#095C2E",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalFunction > rect,"
+    " .LogicalArchitectureBlank g.Box.LogicalFunction > use": {
+        "fill": "#C5FFA6",
+        "stroke": "#095C2E",
+    },
+    ".LogicalArchitectureBlank g.Box.LogicalFunction > text": {
+        "fill": "#095C2E",
+    },
+    ".LogicalArchitectureBlank g.Edge.FunctionalExchange > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.FunctionalExchange > circle": {
+        "fill": "#095C2E",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.FunctionalExchange > path": {
+        "stroke": "#095C2E",
+    },
+    ".LogicalArchitectureBlank g.Edge.FunctionalExchange > text": {
+        "fill": "#095C2E",
+    },
+    ".LogicalArchitectureBlank g.Edge.ComponentExchange > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.ComponentExchange > circle": {
+        "fill": "#4A4A97",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.ComponentExchange > path": {
+        "stroke": "#4A4A97",
+    },
+    ".LogicalArchitectureBlank g.Edge.ComponentExchange > text": {
+        "fill": "#4A4A97",
+    },
+    ".LogicalArchitectureBlank g.Edge.FIPAllocation > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.FIPAllocation > circle": {
+        "fill": "#E08503",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.FIPAllocation > path": {
+        "stroke": "#E08503",
+    },
+    ".LogicalArchitectureBlank g.Edge.FOPAllocation > rect": {
+        "fill": "none",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Circle.FOPAllocation > circle": {
+        "fill": "#095C2E",
+        "stroke": "none",
+    },
+    ".LogicalArchitectureBlank g.Edge.FOPAllocation > path": {
+        "stroke": "#095C2E",
+    },
 }
 
 
-@pytest.fixture(name="tmp_json")
+@pytest.fixture(name="tmp_json", scope="session")
 def tmp_json_fixture(
-    model: capellambse.MelodyModel, tmp_path: pathlib.Path
+    session_shared_model: capellambse.MelodyModel,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> pathlib.Path:
     """Return tmp path of diagram json file."""
-    dest = tmp_path / (TEST_LAB + ".json")
-    diagram_json: str = model.diagrams.by_name(TEST_LAB).render("json_pretty")
-    dest.write_text(diagram_json)
+    dest = tmp_path_factory.mktemp("svg") / (TEST_LAB + ".json")
+    diagram = session_shared_model.diagrams.by_name(TEST_LAB)
+    diagram_json: str = diagram.render("json_pretty")
+    dest.write_bytes(diagram_json.encode("utf-8"))
     return dest
 
 
+@pytest.fixture(name="svg_tree", scope="session")
+def svg_tree_fixture(tmp_json: pathlib.Path) -> etree._Element:
+    """Return the parsed SVG rendered from the diagram json file.
+
+    The tree is shared across the test session and must not be modified.
+    """
+    return etree.fromstring(SVGDiagram.from_json_path(tmp_json).to_string())
+
+
+@pytest.fixture(name="svg_style_rules", scope="session")
+def svg_style_rules_fixture(
+    svg_tree: etree._Element,
+) -> dict[str, list[t.Any]]:
+    """Return the SVG's style rules, indexed by their selector."""
+    rules = collections.defaultdict(list)
+    for rule in cssutils.parseString(XPATH_STYLESHEETS(svg_tree)[0]):
+        if rule.type == rule.STYLE_RULE:
+            rules[rule.selectorText].append(rule)
+    return dict(rules)
+
+
 class TestSVG:
     def test_diagram_meta_data_attributes(
         self, tmp_json: pathlib.Path
     ) -> None:
         diag_meta = generate.DiagramMetadata.from_dict(
-            json.loads(tmp_json.read_text())
+            json.loads(tmp_json.read_bytes())
         )
         assert diag_meta.name == TEST_LAB
         assert diag_meta.pos == (15, 15)
@@ -74,45 +329,20 @@ class TestSVG:
         assert diag_meta.class_ == "Logical Architecture Blank"
 
     def test_diagram_from_json_path_componentports(
-        self, tmp_json: pathlib.Path
+        self, svg_tree: etree._Element
     ) -> None:
-        tree = etree.fromstring(
-            SVGDiagram.from_json_path(tmp_json).to_string()
-        )
-
-        cp_in_exists: bool = False
-        cp_inout_exists: bool = False
-        cp_out_exists: bool = False
-        cp_unset_exists: bool = False
-        cp_reference_exists: bool = False
-
-        for item in tree.iter():
-            # The class CP should not exist anymore as it has been replaced
-            # with CP_IN, CP_OUT, CP_UNSET or CP_INOUT
-            assert item.get("class") != "Box CP"
-
-            # Check that the classes CP_IN, CP_OUT, CP_UNSET and CP_INOUT exist
-            if item.get("class") == "Box CP_IN":
-                cp_in_exists = True
-            elif item.get("class") == "Box CP_OUT":
-                cp_out_exists = True
-            elif item.get("class") == "Box CP_INOUT":
-                cp_inout_exists = True
-            elif item.get("class") == "Box CP_UNSET":
-                cp_unset_exists = True
-
-            # Check that reference symbol for CP exists
-            if (
-                item.tag == "{http://www.w3.org/2000/svg}symbol"
-                and item.get("id") == "ComponentPortSymbol"
-            ):
-                cp_reference_exists = True
-
-        assert cp_in_exists
-        assert cp_out_exists
-        assert cp_inout_exists
-        assert cp_unset_exists
-        assert cp_reference_exists
+        classes = set(XPATH_CLASSES(svg_tree))
+
+        # The class CP should not exist anymore as it has been replaced
+        # with CP_IN, CP_OUT, CP_UNSET or CP_INOUT
+        assert "Box CP" not in classes
+        # Check that the classes CP_IN, CP_OUT, CP_UNSET and CP_INOUT exist
+        assert "Box CP_IN" in classes
+        assert "Box CP_OUT" in classes
+        assert "Box CP_INOUT" in classes
+        assert "Box CP_UNSET" in classes
+        # Check that reference symbol for CP exists
+        assert "ComponentPortSymbol" in XPATH_SYMBOL_IDS(svg_tree)
 
     @pytest.fixture
     def tmp_svg(self, tmp_path: pathlib.Path) -> SVGDiagram:
@@ -128,280 +358,39 @@ class TestSVG:
         tmp_svg.save_drawing()
         assert pathlib.Path(tmp_svg.drawing.filename).is_file()
 
-    # FIXME: change this to a parametrized test, do not use if- or
-    # for-statements in a unit test
-    def test_css_colors(self, tmp_json: pathlib.Path) -> None:
-        COLORS_TO_CHECK = {
-            ".LogicalArchitectureBlank g.Box.CP_IN > line": {
-                "stroke": "#000000"
-            },
-            ".LogicalArchitectureBlank g.Box.CP_IN > rect,"
-            " .LogicalArchitectureBlank g.Box.CP_IN > use": {
-                "fill": "#FFFFFF",
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.CP_OUT > line": {
-                "stroke": "#000000"
-            },
-            ".LogicalArchitectureBlank g.Box.CP_OUT > rect,"
-            " .LogicalArchitectureBlank g.Box.CP_OUT > use": {
-                "fill": "#FFFFFF",
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.CP_INOUT > line": {
-                "stroke": "#000000,"
-            },
-            ".LogicalArchitectureBlank g.Box.CP_INOUT > rect,"
-            " .LogicalArchitectureBlank g.Box.CP_INOUT > use": {
-                "fill": "#FFFFFF",
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Edge > path": {
-                "fill": "none",
-                "stroke": "rgb(0, 0, 0)",
-            },
-            ".LogicalArchitectureBlank g.Box > line": {"stroke": "#000000"},
-            ".LogicalArchitectureBlank g.Box > rect,"
-            " .LogicalArchitectureBlank g.Box > use": {
-                "fill": "transparent",
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.Annotation > line": {
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Box.Annotation > rect,"
-            " .LogicalArchitectureBlank g.Box.Annotation > use": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Box.Constraint > line": {
-                "stroke": "#888888",
-            },
-            ".LogicalArchitectureBlank g.Box.Constraint > rect,"
-            " .LogicalArchitectureBlank g.Box.Constraint > use": {
-                "fill": "#FFF5B5",
-                "stroke": "#888888",
-            },
-            ".LogicalArchitectureBlank g.Box.Constraint > text": {
-                "fill": "#000000"
-            },
-            ".LogicalArchitectureBlank g.Box.Note > line": {
-                "stroke": "#FFCC66"
-            },
-            ".LogicalArchitectureBlank g.Box.Note > rect,"
-            " .LogicalArchitectureBlank g.Box.Note > use": {
-                "fill": " #FFFFCB",
-                "stroke": " #FFCC66",
-            },
-            ".LogicalArchitectureBlank g.Box.Note > text": {
-                "fill": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.Requirement > line": {
-                "stroke": "#72496E",
-            },
-            ".LogicalArchitectureBlank g.Box.Requirement > rect,"
-            " .LogicalArchitectureBlank g.Box.Requirement > use": {
-                "fill": "#D9C4D7",
-                "stroke": "#72496E",
-            },
-            ".LogicalArchitectureBlank g.Box.Requirement > text": {
-                "fill": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.Text > line": {
-                "stroke": "transparent",
-            },
-            ".LogicalArchitectureBlank g.Box.Text > rect,"
-            " .LogicalArchitectureBlank g.Box.Text > use": {
-                "stroke": "transparent",
-            },
-            ".LogicalArchitectureBlank g.Edge > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle > circle": {
-                "fill": "#000000",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.Connector > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.Connector > circle": {
-                "fill": "#B0B0B0",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.Connector > path": {
-                "stroke": "#B0B0B0",
-            },
-            ".LogicalArchitectureBlank g.Edge.Constraint > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.Constraint > circle": {
-                "fill": "#000000",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.Constraint > path": {
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Edge.Note > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.Note > circle": {
-                "fill": "#000000",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.Note > path": {
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Edge.RequirementRelation > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.RequirementRelation"
-            " > circle": {
-                "fill": "#72496E",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.RequirementRelation > path": {
-                "stroke": "#72496E"
-            },
-            ".LogicalArchitectureBlank g.Edge.RequirementRelation > text": {
-                "fill": "#72496E",
-            },
-            ".LogicalArchitectureBlank g.Box.CP > line": {
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.CP > rect,"
-            " .LogicalArchitectureBlank g.Box.CP > use": {
-                "fill": "#FFFFFF",
-                "stroke": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.FIP > rect,"
-            " .LogicalArchitectureBlank g.Box.FIP > use": {
-                "fill": "#E08503",
-            },
-            ".LogicalArchitectureBlank g.Box.FOP > rect,"
-            " .LogicalArchitectureBlank g.Box.FOP > use": {
-                "fill": "#095C2E",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalActor > line": {
-                "stroke": "#4A4A97",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalActor > text": {
-                "fill": "#000000",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalComponent > line": {
-                "stroke": "#4A4A97",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalComponent > text": {
-                "fill": "#4A4A97",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalFunction > line": {
-                "stroke": "#095C2E",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalFunction > rect,"
-            " .LogicalArchitectureBlank g.Box.LogicalFunction > use": {
-                "fill": "#C5FFA6",
-                "stroke": "#095C2E",
-            },
-            ".LogicalArchitectureBlank g.Box.LogicalFunction > text": {
-                "fill": "#095C2E",
-            },
-            ".LogicalArchitectureBlank g.Edge.FunctionalExchange > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.FunctionalExchange > circle": {
-                "fill": "#095C2E",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.FunctionalExchange > path": {
-                "stroke": "#095C2E",
-            },
-            ".LogicalArchitectureBlank g.Edge.FunctionalExchange > text": {
-                "fill": "#095C2E",
-            },
-            ".LogicalArchitectureBlank g.Edge.ComponentExchange > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.ComponentExchange > circle": {
-                "fill": "#4A4A97",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.ComponentExchange > path": {
-                "stroke": "#4A4A97",
-            },
-            ".LogicalArchitectureBlank g.Edge.ComponentExchange > text": {
-                "fill": "#4A4A97",
-            },
-            ".LogicalArchitectureBlank g.Edge.FIPAllocation > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.FIPAllocation > circle": {
-                "fill": "#E08503",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.FIPAllocation > path": {
-                "stroke": "#E08503",
-            },
-            ".LogicalArchitectureBlank g.Edge.FOPAllocation > rect": {
-                "fill": "none",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Circle.FOPAllocation > circle": {
-                "fill": "#095C2E",
-                "stroke": "none",
-            },
-            ".LogicalArchitectureBlank g.Edge.FOPAllocation > path": {
-                "stroke": "#095C2E",
-            },
-        }
-
-        tree = etree.fromstring(
-            SVGDiagram.from_json_path(tmp_json).to_string()
-        )
-        style_ = tree.xpath(
-            "/x:svg/x:defs/x:style",
-            namespaces={"x": "http://www.w3.org/2000/svg"},
-        )[0]
-
-        stylesheet = cssutils.parseString(style_.text)
-        for rule in stylesheet:
-            for element, prop in COLORS_TO_CHECK.items():
-                if (
-                    rule.type == rule.STYLE_RULE
-                    and rule.selectorText == element
-                ):
-                    for key, val in prop.items():
-                        try:
-                            property_value = rule.style.getProperty(
-                                key
-                            ).propertyValue.value
-                        except AttributeError:
-                            # FIXME: rules are duplicated with different
-                            # values -> should be merged first
-                            print(f"Missing attribute {key}")
-                            continue
-                        if val == "none":
-                            assert property_value == "none"
-                        elif key in ["fill", "stroke"]:
-                            assert (
-                                property_value
-                                == cssutils.css.ColorValue(val).value
-                            )
-                        else:
-                            raise NotImplementedError
+    @pytest.mark.parametrize(
+        ["selector", "key", "expected"],
+        [
+            (selector, key, value)
+            for selector, props in CSS_COLORS_TO_CHECK.items()
+            for key, value in props.items()
+        ],
+    )
+    def test_css_colors(
+        self,
+        svg_style_rules: dict[str, list[t.Any]],
+        selector: str,
+        key: str,
+        expected: str,
+    ) -> None:
+        # FIXME: rules are duplicated with different values -> should be
+        # merged first, instead of ignoring the ones missing the property
+        actual = [
+            prop.propertyValue.value
+            for rule in svg_style_rules.get(selector, ())
+            if (prop := rule.style.getProperty(key)) is not None
+        ]
+        if expected != "none":
+            expected = cssutils.css.ColorValue(expected).value
+
+        assert all(i == expected for i in actual)
 
     @pytest.mark.parametrize("diagram_name", TEST_DIAGS)
     def test_diagram_decorations(
-        self, model: capellambse.MelodyModel, diagram_name: str
+        self, session_shared_model: capellambse.MelodyModel, diagram_name: str
     ):
         """Test diagrams get rendered successfully."""
-        diag = model.diagrams.by_name(diagram_name)
+        diag = session_shared_model.diagrams.by_name(diagram_name)
         diag.render("svg")
 
 
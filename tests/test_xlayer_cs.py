@@ -1,10 +1,27 @@
 # SPDX-FileCopyrightText: Copyright DB Netz AG and the capellambse contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import pytest
+
 from capellambse import MelodyModel
+from capellambse.model.crosslayer import cs
+
+
+@pytest.fixture(name="card_path", scope="module")
+def card_path_fixture(session_shared_model: MelodyModel) -> cs.PhysicalPath:
+    return session_shared_model.pa.all_physical_paths.by_name(
+        "card1 - card2 connection"
+    )
+
+
+@pytest.fixture(name="eth_cable", scope="module")
+def eth_cable_fixture(session_shared_model: MelodyModel) -> cs.PhysicalLink:
+    return session_shared_model.pa.all_physical_links.by_name("Eth Cable 2")
 
 
-def test_PhysicalPath_has_ordered_list_of_involved_items(model: MelodyModel):
+def test_PhysicalPath_has_ordered_list_of_involved_items(
+    card_path: cs.PhysicalPath,
+):
     expected = [
         "544549d6-2aa4-44c2-b2ae-a86302f48e62",
         "42ee9e89-d445-45a2-8280-028d4fb1038d",
@@ -13,40 +30,40 @@ def test_PhysicalPath_has_ordered_list_of_involved_items(model: MelodyModel):
         "baa3047c-9cb4-40a7-9b67-b9b5f76fd2ee",
     ]
 
-    path = model.pa.all_physical_paths.by_name("card1 - card2 connection")
-
-    actual = [i.uuid for i in path.involved_items]
+    actual = [i.uuid for i in card_path.involved_items]
     assert actual == expected
 
 
-def test_PhysicalPath_has_ordered_list_of_involved_links(model: MelodyModel):
+def test_PhysicalPath_has_ordered_list_of_involved_links(
+    card_path: cs.PhysicalPath,
+):
     expected = [
         "42ee9e89-d445-45a2-8280-028d4fb1038d",
         "3078ec08-956a-4c61-87ed-0143d1d66715",
     ]
 
-    path = model.pa.all_physical_paths.by_name("card1 - card2 connection")
-
-    actual = [i.uuid for i in path.involved_links]
+    actual = [i.uuid for i in card_path.involved_links]
     assert actual == expected
 
 
-def test_PhysicalPath_has_exchanges(model: MelodyModel):
-    exchange = model.pa.all_component_exchanges.by_name("C 6")
-    path = model.pa.all_physical_paths.by_name("card1 - card2 connection")
-    assert path.exchanges == [exchange]
+def test_PhysicalPath_has_exchanges(
+    session_shared_model: MelodyModel, card_path: cs.PhysicalPath
+):
+    exchange = session_shared_model.pa.all_component_exchanges.by_name("C 6")
+    assert card_path.exchanges == [exchange]
 
 
-def test_PhysicalLink_has_physical_paths(model: MelodyModel):
-    link = model.pa.all_physical_links.by_name("Eth Cable 2")
-    path = model.pa.all_physical_paths.by_name("card1 - card2 connection")
-    assert link.physical_paths == [path]
+def test_PhysicalLink_has_physical_paths(
+    eth_cable: cs.PhysicalLink, card_path: cs.PhysicalPath
+):
+    assert eth_cable.physical_paths == [card_path]
 
 
-def test_PhysicalLink_has_exchanges(model: MelodyModel):
-    link = model.pa.all_physical_links.by_name("Eth Cable 2")
-    exchange = model.pa.all_component_exchanges.by_name("C 3")
-    assert link.exchanges == [exchange]
+def test_PhysicalLink_has_exchanges(
+    session_shared_model: MelodyModel, eth_cable: cs.PhysicalLink
+):
+    exchange = session_shared_model.pa.all_component_exchanges.by_name("C 3")
+    assert eth_cable.exchanges == [exchange]
 
 
 def test_PhysicalLink_setting_ends(model: MelodyModel):